@@ -4,10 +4,186 @@ Profiling Wrapper Module
 A wrapper class that enables timing of object methods with statistical profiling capabilities.
 """
 
+import sys
 import time
+import array
+import functools
+import inspect
+import threading
+import weakref
 import numpy as np
-from typing import Any, Dict, List
-from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+try:
+    from fast_histogram import histogram1d
+except ImportError:  # fast-histogram is optional
+    histogram1d = None
+
+
+def _numpy_fused_stats(a: np.ndarray) -> tuple:
+    """
+    Compute running-statistics terms with plain NumPy reductions.
+    
+    Args:
+        a: Non-empty contiguous int64 array of samples
+        
+    Returns:
+        Tuple of (count, sum, min, max, mean, m2) as floats, where m2 is the
+        sum of squared deviations from the mean
+    """
+    return (
+        float(len(a)),
+        float(np.sum(a)),
+        float(np.min(a)),
+        float(np.max(a)),
+        float(np.mean(a)),
+        float(np.var(a)) * len(a),
+    )
+
+
+def _fused_stats_kernel(a):
+    """
+    Compute running-statistics terms in a single pass.
+    
+    Uses Welford's algorithm for the variance. Intended to be compiled
+    with numba; see _numpy_fused_stats for the fallback.
+    
+    Args:
+        a: Non-empty contiguous int64 array of samples
+        
+    Returns:
+        Tuple of (count, sum, min, max, mean, m2) as floats, where m2 is the
+        sum of squared deviations from the mean
+    """
+    n = a.shape[0]
+    total = 0.0
+    min_val = float(a[0])
+    max_val = min_val
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = float(a[i])
+        total += x
+        if x < min_val:
+            min_val = x
+        if x > max_val:
+            max_val = x
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+    
+    return (float(n), total, min_val, max_val, mean, m2)
+
+
+def _compile_fused_stats() -> Callable:
+    """
+    Compile the statistics kernel, falling back to NumPy without numba.
+    
+    The pinned signature makes numba compile at import time rather than on
+    the first get_statistics() call, and cache=True stores the machine code
+    on disk so later processes skip compilation entirely.
+    
+    Returns:
+        Callable with the _numpy_fused_stats interface
+    """
+    if njit is None:
+        return _numpy_fused_stats
+    
+    signature = 'UniTuple(float64, 6)(int64[::1])'
+    options = {'fastmath': True, 'boundscheck': False}
+    try:
+        return njit(signature, cache=True, **options)(_fused_stats_kernel)
+    except RuntimeError:
+        # No writable cache location; compile for this process only
+        return njit(signature, **options)(_fused_stats_kernel)
+
+
+_fused_stats = _compile_fused_stats()
+
+
+def _make_timed_method(
+    attr: Callable,
+    local: threading.local,
+    new_buffer: Callable,
+    observe: Optional[Callable] = None,
+) -> Callable:
+    """
+    Build the callable that times one method.
+    
+    This is the only code that runs on every profiled call, so everything
+    it needs is bound as closure variables up front, and the variant with
+    or without observe is chosen here rather than on each call.
+    
+    Args:
+        attr: Method to call
+        local: Thread-local holding the calling thread's bound buffer append
+        new_buffer: Creates and registers a buffer for the calling thread,
+            returning its bound append
+        observe: Optional hook called with each elapsed time in nanoseconds
+        
+    Returns:
+        Callable that forwards to attr and records the elapsed nanoseconds
+    """
+    _perf = time.perf_counter_ns
+    
+    def timed_method(*args, **kwargs):
+        start_time = _perf()
+        result = attr(*args, **kwargs)
+        elapsed = _perf() - start_time
+        try:
+            local.append(elapsed)
+        except AttributeError:
+            # First call of this method on the current thread
+            new_buffer()(elapsed)
+        return result
+    
+    if observe is None:
+        return timed_method
+    
+    def observed_method(*args, **kwargs):
+        start_time = _perf()
+        result = attr(*args, **kwargs)
+        elapsed = _perf() - start_time
+        try:
+            local.append(elapsed)
+        except AttributeError:
+            # First call of this method on the current thread
+            new_buffer()(elapsed)
+        observe(elapsed)
+        return result
+    
+    return observed_method
+
+
+def _make_noise_detector(threshold_ns: int, max_streak: int, on_noise: Callable) -> Callable:
+    """
+    Build an observe hook that reports methods faster than the timer.
+    
+    Args:
+        threshold_ns: Samples below this many nanoseconds count as noise
+        max_streak: Consecutive noise samples before on_noise is called
+        on_noise: Called with no arguments to stop profiling the method
+        
+    Returns:
+        Callable taking one elapsed time in nanoseconds
+    """
+    streak = 0
+    
+    def observe(elapsed: int) -> None:
+        nonlocal streak
+        if elapsed < threshold_ns:
+            streak += 1
+            if streak >= max_streak:
+                on_noise()
+        else:
+            streak = 0
+    
+    return observe
 
 
 class ProfilingWrapper:
@@ -18,18 +194,118 @@ class ProfilingWrapper:
     Profiling data can be retrieved using get_profiling_data().
     """
     
-    # Class-level dictionary to store timing data
-    _profiling_data: Dict[str, List[float]] = defaultdict(list)
+    # Internal state lives in slots; __dict__ only holds cached timed methods.
+    # Slots are data descriptors and would take precedence over __dict__, so
+    # they carry the _profiling_wrapper_ prefix to stay clear of method names.
+    __slots__ = (
+        '_profiling_wrapper_wrapped_obj',
+        '_profiling_wrapper_class_name',
+        '_profiling_wrapper_method_names',
+        '_profiling_wrapper_excluded',
+        '_profiling_wrapper_variants',
+        '_profiling_wrapper_auto_disable_below_ns',
+        '_profiling_wrapper_noise_detectors',
+        '_profiling_wrapper_noisy',
+        '__dict__',
+        '__weakref__',
+    )
+    
+    # Class-level dictionary to store timing data as packed int64 nanoseconds.
+    # Each method has one buffer per thread that has called it, so threads
+    # never grow a shared buffer; buffers are merged when read. The owning
+    # thread of each buffer is tracked in the parallel _buffer_owners list so
+    # clear_profiling_data() can drop buffers of threads that have exited.
+    _profiling_data: Dict[str, List[array.array]] = {}
+    _buffer_owners: Dict[str, List[weakref.ref]] = {}
+    _thread_buffers: Dict[str, threading.local] = {}
+    _profiling_lock = threading.Lock()
+    
+    # Method names per wrapped class, computed on first wrap
+    _method_names_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    
+    # Interned "{cls_name}.{method_name}" keys, shared by every wrapper
+    _method_keys: Dict[Tuple[str, str], str] = {}
+    
+    # Running [count, total, min, max, mean, m2, seen] per method, where seen
+    # holds how many samples of each per-thread buffer are already included
+    _running_stats: Dict[str, list] = {}
+    
+    # Most recent histogram per method, stored as ((bins, range), sample
+    # count, (counts, edges)) so it can be reused until new calls arrive
+    _histogram_cache: Dict[str, Tuple[Tuple[int, Any], int, Tuple[np.ndarray, np.ndarray]]] = {}
     
-    def __init__(self, obj: Any):
+    # Consecutive sub-threshold calls before auto_disable_below_ns kicks in
+    _auto_disable_calls: int = 100
+    
+    # Whether newly cached methods are timed, and the wrappers to update on toggle
+    _profiling_enabled: bool = True
+    _profiling_instances: weakref.WeakSet = weakref.WeakSet()
+    
+    def __init__(
+        self,
+        obj: Any,
+        exclude: Optional[Iterable[str]] = None,
+        auto_disable_below_ns: Optional[int] = None,
+    ):
         """
         Initialize the profiling wrapper.
         
         Args:
             obj: Any object whose methods should be profiled
+            exclude: Optional method name, or iterable of names, to pass
+                through without timing
+            auto_disable_below_ns: Optional threshold in nanoseconds. A method
+                or other callable whose last 100 consecutive calls were all
+                faster than this stops being profiled on this wrapper, since
+                its samples are dominated by timer and wrapper overhead.
+        """
+        if exclude is None:
+            excluded = frozenset()
+        elif isinstance(exclude, str):
+            excluded = frozenset((exclude,))
+        else:
+            excluded = frozenset(exclude)
+        
+        # Bypass __setattr__ so internal setup skips the name check
+        object.__setattr__(self, '_profiling_wrapper_wrapped_obj', obj)
+        object.__setattr__(self, '_profiling_wrapper_class_name', obj.__class__.__name__)
+        object.__setattr__(self, '_profiling_wrapper_method_names', self._find_method_names(obj) - excluded)
+        object.__setattr__(self, '_profiling_wrapper_excluded', excluded)
+        object.__setattr__(self, '_profiling_wrapper_auto_disable_below_ns', auto_disable_below_ns)
+        # Streak detectors for callables wrapped per access, and the names
+        # they have disabled
+        object.__setattr__(self, '_profiling_wrapper_noise_detectors', {})
+        object.__setattr__(self, '_profiling_wrapper_noisy', set())
+        # Maps method name to its (timed, passthrough) callables
+        object.__setattr__(self, '_profiling_wrapper_variants', {})
+        ProfilingWrapper._profiling_instances.add(self)
+    
+    @classmethod
+    def _find_method_names(cls, obj: Any) -> frozenset:
+        """
+        Collect the names of methods defined on an object's class hierarchy.
+        
+        Dunder methods and nested classes are left out. The result is
+        computed once per class. These names get a cached timed method;
+        other callables are still profiled through the slower per-access
+        path in __getattr__.
+        
+        Args:
+            obj: Object being wrapped
+            
+        Returns:
+            Frozenset of method names that should be profiled
         """
-        self._profiling_wrapper_wrapped_obj = obj
-        self._profiling_wrapper_class_name = obj.__class__.__name__
+        klass = type(obj)
+        names = cls._method_names_cache.get(klass)
+        if names is None:
+            names = frozenset(
+                name
+                for name, value in inspect.getmembers(klass, predicate=callable)
+                if not name.startswith('__') and not inspect.isclass(value)
+            )
+            cls._method_names_cache[klass] = names
+        return names
     
     def __getattr__(self, name: str) -> Any:
         """
@@ -41,31 +317,132 @@ class ProfilingWrapper:
         Returns:
             The attribute value, wrapped if it's a callable method
         """
-        attr = getattr(self._profiling_wrapper_wrapped_obj, name)
+        obj = self._profiling_wrapper_wrapped_obj
+        attr = getattr(obj, name)
+        
+        # Data attributes are returned before any other check
+        if not callable(attr):
+            return attr
+        
+        # Methods defined on the class take the cached fast path below.
+        # Other callables (module functions, callables set on the instance,
+        # including ones shadowing a class method, attributes served by the
+        # object's own __getattr__) are wrapped per access, since they may
+        # change.
+        instance_dict = getattr(obj, '__dict__', None)
+        shadowed = isinstance(instance_dict, dict) and name in instance_dict
+        if shadowed or name not in self._profiling_wrapper_method_names:
+            if (
+                name in self._profiling_wrapper_excluded
+                or name in self._profiling_wrapper_noisy
+                or not ProfilingWrapper._profiling_enabled
+            ):
+                return attr
+            return self._wrap_per_access(name, attr)
+        
+        return self._cache_timed_method(name, attr)
+    
+    def _wrap_per_access(self, name: str, attr: Callable) -> Callable:
+        """
+        Wrap a callable that is not cached on the wrapper.
+        
+        A fresh timed callable is built on each access. With
+        auto_disable_below_ns set, the noise streak is kept per name across
+        accesses, and a name it disables is then returned untimed.
+        
+        Args:
+            name: Attribute name
+            attr: Callable read from the wrapped object
+            
+        Returns:
+            Timed callable forwarding to attr
+        """
+        key = ProfilingWrapper._method_key(self._profiling_wrapper_class_name, name)
+        threshold_ns = self._profiling_wrapper_auto_disable_below_ns
+        if threshold_ns is None:
+            return ProfilingWrapper._new_timed_method(key, attr)
         
-        # If it's a method, wrap it with timing logic
-        if callable(attr):
-            def timed_method(*args, **kwargs):
-                key = f"{self._profiling_wrapper_class_name}.{name}"
-                
-                start_time = time.perf_counter()
-                result = attr(*args, **kwargs)
-                end_time = time.perf_counter()
-                
-                execution_time = end_time - start_time
-                ProfilingWrapper._profiling_data[key].append(execution_time)
-                
-                return result
+        detectors = self._profiling_wrapper_noise_detectors
+        observe = detectors.get(name)
+        if observe is None:
+            observe = _make_noise_detector(
+                threshold_ns,
+                ProfilingWrapper._auto_disable_calls,
+                functools.partial(self._profiling_wrapper_noisy.add, name),
+            )
+            detectors[name] = observe
+        return ProfilingWrapper._new_timed_method(key, attr, observe)
+    
+    def _cache_timed_method(self, name: str, attr: Callable) -> Callable:
+        """
+        Wrap a class-defined method and cache it on the wrapper.
+        
+        Kept out of __getattr__ so the closures built here do not give
+        __getattr__ cell variables, which would slow every attribute read.
+        
+        Args:
+            name: Method name
+            attr: Bound method of the wrapped object
             
-            return timed_method
+        Returns:
+            The cached callable, timed unless profiling is disabled
+        """
+        key = ProfilingWrapper._method_key(self._profiling_wrapper_class_name, name)
+        threshold_ns = self._profiling_wrapper_auto_disable_below_ns
+        if threshold_ns is not None:
+            cached = self.__dict__
+            variants = self._profiling_wrapper_variants
+            
+            def stop_profiling():
+                # Keep the passthrough even if profiling is toggled later
+                variants[name] = (attr, attr)
+                cached[name] = attr
+            
+            observe = _make_noise_detector(
+                threshold_ns,
+                ProfilingWrapper._auto_disable_calls,
+                stop_profiling,
+            )
+        else:
+            observe = None
         
-        # If it's not a method, return it as-is
-        return attr
+        timed_method = ProfilingWrapper._new_timed_method(key, attr, observe)
+        
+        # Cache on the instance so later lookups never reach __getattr__.
+        # Toggling profiling swaps the cached variant instead of branching
+        # on every call.
+        self._profiling_wrapper_variants[name] = (timed_method, attr)
+        method = timed_method if ProfilingWrapper._profiling_enabled else attr
+        object.__setattr__(self, name, method)
+        return method
+    
+    @classmethod
+    def _new_timed_method(cls, key: str, attr: Callable, observe: Optional[Callable] = None) -> Callable:
+        """
+        Build a timed callable recording into a method's buffers.
+        
+        Args:
+            key: Method key in format "{cls_name}.{method_name}"
+            attr: Callable to time
+            observe: Optional hook called with each elapsed time in nanoseconds
+            
+        Returns:
+            Timed callable from _make_timed_method
+        """
+        return _make_timed_method(
+            attr,
+            cls._get_thread_local(key),
+            lambda: cls._new_thread_buffer(key),
+            observe,
+        )
     
     def __setattr__(self, name: str, value: Any) -> None:
         """
         Handle attribute setting.
         
+        Internal state is assigned directly in __init__, so only attributes
+        set by users take this path.
+        
         Args:
             name: Attribute name
             value: Value to set
@@ -74,8 +451,44 @@ class ProfilingWrapper:
         if name.startswith('_profiling_wrapper_'):
             super().__setattr__(name, value)
         else:
+            # Drop any cached timed method so the new value is picked up
+            self.__dict__.pop(name, None)
+            self._profiling_wrapper_variants.pop(name, None)
+            self._profiling_wrapper_noise_detectors.pop(name, None)
+            self._profiling_wrapper_noisy.discard(name)
             setattr(self._profiling_wrapper_wrapped_obj, name, value)
     
+    @classmethod
+    def enable_profiling(cls) -> None:
+        """
+        Enable timing of method calls on all wrappers.
+        """
+        cls._set_profiling_enabled(True)
+    
+    @classmethod
+    def disable_profiling(cls) -> None:
+        """
+        Disable timing of method calls on all wrappers.
+        
+        Wrapped methods call straight through to the original object
+        until enable_profiling() is called.
+        """
+        cls._set_profiling_enabled(False)
+    
+    @classmethod
+    def _set_profiling_enabled(cls, enabled: bool) -> None:
+        """
+        Swap the cached method variant on every live wrapper.
+        
+        Args:
+            enabled: True to install timed methods, False for passthroughs
+        """
+        ProfilingWrapper._profiling_enabled = enabled
+        for wrapper in list(ProfilingWrapper._profiling_instances):
+            cached = wrapper.__dict__
+            for name, (timed_method, attr) in wrapper._profiling_wrapper_variants.items():
+                cached[name] = timed_method if enabled else attr
+    
     @classmethod
     def get_profiling_data(cls, key: str) -> np.ndarray:
         """
@@ -87,19 +500,117 @@ class ProfilingWrapper:
         Returns:
             NumPy array of execution times (in seconds)
         """
-        if key in cls._profiling_data:
-            return np.array(cls._profiling_data[key])
-        return np.array([])
+        return cls._get_raw_data(key) * 1e-9
+    
+    @classmethod
+    def _method_key(cls, class_name: str, name: str) -> str:
+        """
+        Get the interned profiling key for a class and method name.
+        
+        Args:
+            class_name: Name of the wrapped object's class
+            name: Method name
+            
+        Returns:
+            Key in format "{cls_name}.{method_name}"
+        """
+        key = cls._method_keys.get((class_name, name))
+        if key is None:
+            key = sys.intern(f"{class_name}.{name}")
+            cls._method_keys[(class_name, name)] = key
+        return key
+    
+    @classmethod
+    def _get_thread_local(cls, key: str) -> threading.local:
+        """
+        Get the thread-local that holds each thread's buffer for a method.
+        
+        Args:
+            key: Method key in format "{cls_name}.{method_name}"
+            
+        Returns:
+            The method's threading.local, created on first use
+        """
+        with cls._profiling_lock:
+            cls._profiling_data.setdefault(key, [])
+            cls._buffer_owners.setdefault(key, [])
+            return cls._thread_buffers.setdefault(key, threading.local())
+    
+    @classmethod
+    def _new_thread_buffer(cls, key: str) -> Callable:
+        """
+        Create and register the calling thread's buffer for a method.
+        
+        The buffer stays registered after the thread exits so its samples
+        are kept until the next clear_profiling_data().
+        
+        Args:
+            key: Method key in format "{cls_name}.{method_name}"
+            
+        Returns:
+            Bound append of the new buffer
+        """
+        buffer = array.array('q')
+        with cls._profiling_lock:
+            cls._profiling_data[key].append(buffer)
+            cls._buffer_owners[key].append(weakref.ref(threading.current_thread()))
+        cls._thread_buffers[key].append = buffer.append
+        return buffer.append
+    
+    @classmethod
+    def _sample_count(cls, key: str) -> int:
+        """
+        Count the samples recorded for a method across all threads.
+        
+        Args:
+            key: Method key in format "{cls_name}.{method_name}"
+            
+        Returns:
+            Number of recorded calls
+        """
+        return sum(len(buffer) for buffer in cls._profiling_data.get(key, ()))
+    
+    @classmethod
+    def _get_raw_data(cls, key: str) -> np.ndarray:
+        """
+        Merge the raw samples for a method out of its per-thread buffers.
+        
+        Args:
+            key: Method key in format "{cls_name}.{method_name}"
+            
+        Returns:
+            NumPy int64 array of execution times (in nanoseconds)
+        """
+        # array.extend copies without exporting the source buffers, so
+        # threads can keep appending. The merged array is private, so the
+        # returned view over it is safe.
+        merged = array.array('q')
+        for buffer in list(cls._profiling_data.get(key, ())):
+            merged.extend(buffer)
+        return np.frombuffer(merged, dtype=np.int64)
     
     @classmethod
-    def get_all_profiling_data(cls) -> Dict[str, np.ndarray]:
+    def get_all_profiling_data(cls, raw: bool = False) -> Dict[str, np.ndarray]:
         """
         Retrieve all profiling data.
         
+        Args:
+            raw: If True, return the int64 nanosecond samples as stored,
+                with no float conversion. Arrays are always copies because an
+                exported view would stop the underlying buffers from growing
+                on the next call.
+        
         Returns:
             Dictionary mapping method keys to NumPy arrays of execution times
+            (in seconds, or nanoseconds if raw). Methods without recorded
+            calls are omitted.
         """
-        return {key: np.array(times) for key, times in cls._profiling_data.items()}
+        all_data = {}
+        for key in list(cls._profiling_data):
+            data = cls._get_raw_data(key)
+            if len(data):
+                all_data[key] = data if raw else data * 1e-9
+        return all_data
     
     @classmethod
     def clear_profiling_data(cls, key: str = None) -> None:
@@ -109,10 +620,43 @@ class ProfilingWrapper:
         Args:
             key: Optional specific method key to clear. If None, clears all data.
         """
-        if key is None:
-            cls._profiling_data.clear()
-        elif key in cls._profiling_data:
-            cls._profiling_data[key].clear()
+        # The lock keeps a concurrent get_statistics() from folding samples
+        # into stats that are being reset.
+        with cls._profiling_lock:
+            if key is None:
+                for method_key in cls._profiling_data:
+                    cls._reset_buffers(method_key)
+                cls._running_stats.clear()
+                cls._histogram_cache.clear()
+            elif key in cls._profiling_data:
+                cls._reset_buffers(key)
+                cls._running_stats.pop(key, None)
+                cls._histogram_cache.pop(key, None)
+    
+    @classmethod
+    def _reset_buffers(cls, key: str) -> None:
+        """
+        Empty a method's buffers and drop those of threads that have exited.
+        
+        Live threads keep their buffer, emptied in place, because their
+        thread-local still appends to it. The caller must hold the
+        profiling lock.
+        
+        Args:
+            key: Method key in format "{cls_name}.{method_name}"
+        """
+        buffers = cls._profiling_data[key]
+        owners = cls._buffer_owners[key]
+        kept_buffers = []
+        kept_owners = []
+        for buffer, owner in zip(buffers, owners):
+            thread = owner()
+            if thread is not None and thread.is_alive():
+                del buffer[:]
+                kept_buffers.append(buffer)
+                kept_owners.append(owner)
+        buffers[:] = kept_buffers
+        owners[:] = kept_owners
     
     @classmethod
     def get_statistics(cls, key: str) -> Dict[str, float]:
@@ -125,9 +669,9 @@ class ProfilingWrapper:
         Returns:
             Dictionary with statistics (mean, median, std, min, max, total, count)
         """
-        data = cls.get_profiling_data(key)
+        count, total, min_val, max_val, mean, m2 = cls._update_running_stats(key)
         
-        if len(data) == 0:
+        if count == 0:
             return {
                 'count': 0,
                 'mean': 0.0,
@@ -138,13 +682,112 @@ class ProfilingWrapper:
                 'total': 0.0
             }
         
+        # The median is the only statistic that needs every sample
+        median = float(np.median(cls._get_raw_data(key)))
+        
         return {
-            'count': len(data),
-            'mean': float(np.mean(data)),
-            'median': float(np.median(data)),
-            'std': float(np.std(data)),
-            'min': float(np.min(data)),
-            'max': float(np.max(data)),
-            'total': float(np.sum(data))
+            'count': int(count),
+            'mean': mean * 1e-9,
+            'median': median * 1e-9,
+            'std': float(np.sqrt(m2 / count)) * 1e-9,
+            'min': min_val * 1e-9,
+            'max': max_val * 1e-9,
+            'total': total * 1e-9
         }
-
+    
+    @classmethod
+    def _update_running_stats(cls, key: str) -> tuple:
+        """
+        Fold samples recorded since the last call into a method's running stats.
+        
+        Only the new tail of each per-thread buffer is scanned, and it is
+        combined with the previous totals using Chan's parallel update.
+        Values are kept in nanoseconds. Holds the profiling lock so
+        concurrent callers never fold the same samples twice.
+        
+        Args:
+            key: Method key in format "{cls_name}.{method_name}"
+            
+        Returns:
+            Snapshot of (count, total, min, max, mean, m2)
+        """
+        with cls._profiling_lock:
+            running = cls._running_stats.get(key)
+            if running is None:
+                running = [0.0, 0.0, float('inf'), float('-inf'), 0.0, 0.0, []]
+                cls._running_stats[key] = running
+            
+            buffers = list(cls._profiling_data.get(key, ()))
+            seen = running[6]
+            seen.extend([0] * (len(buffers) - len(seen)))
+            
+            new = array.array('q')
+            for i, buffer in enumerate(buffers):
+                end = len(buffer)
+                if end > seen[i]:
+                    new.extend(buffer[seen[i]:end])
+                    seen[i] = end
+            
+            if new:
+                count_b, total_b, min_b, max_b, mean_b, m2_b = _fused_stats(
+                    np.frombuffer(new, dtype=np.int64)
+                )
+                count_a, mean_a = running[0], running[4]
+                count = count_a + count_b
+                delta = mean_b - mean_a
+                running[0] = count
+                running[1] += total_b
+                running[2] = min(running[2], min_b)
+                running[3] = max(running[3], max_b)
+                running[4] = mean_a + delta * count_b / count
+                running[5] += m2_b + delta * delta * count_a * count_b / count
+            
+            return tuple(running[:6])
+    
+    @classmethod
+    def get_histogram(
+        cls,
+        key: str,
+        bins: int = 256,
+        range: Optional[Tuple[float, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get a uniform-bin histogram of a method's execution times.
+        
+        The most recent result for each method is cached until the method
+        records new calls, so repeated queries with the same bins and range
+        do not rescan the samples. Asking for different bins or range
+        replaces the cached entry. Uses fast-histogram when installed.
+        
+        Args:
+            key: Method key in format "{cls_name}.{method_name}"
+            bins: Number of equal-width bins
+            range: Optional (min, max) in seconds. Defaults to the data range.
+            
+        Returns:
+            Tuple of (counts, bin_edges) as returned by np.histogram
+        """
+        # range may be any (min, max) sequence np.histogram accepts, such as
+        # a list, so normalize it before using it in the cache
+        params = (bins, None if range is None else tuple(float(v) for v in range))
+        cached = cls._histogram_cache.get(key)
+        if cached is not None and cached[0] == params and cached[1] == cls._sample_count(key):
+            counts, edges = cached[2]
+            return counts.copy(), edges.copy()
+        
+        data = cls.get_profiling_data(key)
+        
+        if histogram1d is None or len(data) == 0:
+            counts, edges = np.histogram(data, bins=bins, range=range)
+        else:
+            lo, hi = range if range is not None else (data.min(), data.max())
+            if lo == hi:
+                lo, hi = lo - 0.5, hi + 0.5
+            counts = histogram1d(data, bins, (lo, hi)).astype(np.int64)
+            # fast-histogram treats the upper edge as exclusive, np.histogram
+            # puts it in the last bin
+            counts[-1] += np.count_nonzero(data == hi)
+            edges = np.linspace(lo, hi, bins + 1)
+        
+        cls._histogram_cache[key] = (params, len(data), (counts, edges))
+        return counts.copy(), edges.copy()
@@ -2,7 +2,10 @@
 Test suite for ProfilingWrapper
 """
 
+import math
 import time
+import threading
+from types import SimpleNamespace
 from profiling_wrapper import ProfilingWrapper
 
 
@@ -212,6 +215,316 @@ def test_nonexistent_method():
     print("Nonexistent method test passed!")
 
 
+def test_cached_method_after_clear():
+    """Test that cached timed methods keep recording after a clear."""
+    print("\n" + "=" * 60)
+    print("Test 8: Cached Method After Clear")
+    print("=" * 60)
+    
+    obj = ProfilingWrapper(SampleClass())
+    
+    obj.increment_counter()
+    first = obj.increment_counter
+    ProfilingWrapper.clear_profiling_data()
+    obj.increment_counter()
+    
+    times = ProfilingWrapper.get_profiling_data("SampleClass.increment_counter")
+    
+    print(f"\nCalls recorded after clear: {len(times)}")
+    
+    assert obj.increment_counter is first, "Timed method should be cached"
+    assert len(times) == 1, "Cached method should record into the live buffer"
+    
+    print("Cached method after clear test passed!")
+
+
+def test_disable_profiling():
+    """Test that disabling profiling stops recording on existing wrappers."""
+    print("\n" + "=" * 60)
+    print("Test 9: Disable Profiling")
+    print("=" * 60)
+    
+    ProfilingWrapper.clear_profiling_data()
+    
+    obj = ProfilingWrapper(SampleClass())
+    obj.increment_counter()
+    
+    ProfilingWrapper.disable_profiling()
+    try:
+        obj.increment_counter()
+        other = ProfilingWrapper(SampleClass())
+        other.increment_counter()
+    finally:
+        ProfilingWrapper.enable_profiling()
+    
+    obj.increment_counter()
+    
+    times = ProfilingWrapper.get_profiling_data("SampleClass.increment_counter")
+    
+    print(f"\nCalls recorded: {len(times)}")
+    print(f"Final counter value: {obj.counter}")
+    
+    assert len(times) == 2, "Calls made while disabled should not be recorded"
+    assert obj.counter == 3, "Disabled calls should still reach the object"
+    
+    print("Disable profiling test passed!")
+
+
+def test_histogram():
+    """Test histogram summary of profiling data."""
+    print("\n" + "=" * 60)
+    print("Test 10: Histogram")
+    print("=" * 60)
+    
+    ProfilingWrapper.clear_profiling_data()
+    
+    obj = ProfilingWrapper(SampleClass())
+    
+    for _ in range(20):
+        obj.increment_counter()
+    
+    counts, edges = ProfilingWrapper.get_histogram("SampleClass.increment_counter", bins=8)
+    
+    print(f"\nHistogram counts: {counts}")
+    print(f"Bin edges: {edges}")
+    
+    assert len(counts) == 8, "Should have 8 bins"
+    assert len(edges) == 9, "Should have 9 bin edges"
+    assert counts.sum() == 20, "Every call should fall in a bin"
+    
+    obj.increment_counter()
+    counts, _ = ProfilingWrapper.get_histogram("SampleClass.increment_counter", bins=8)
+    
+    assert counts.sum() == 21, "Histogram should refresh after new calls"
+    
+    counts, edges = ProfilingWrapper.get_histogram("SampleClass.increment_counter", bins=4, range=[0, 1])
+    
+    assert len(counts) == 4, "List range should be accepted like np.histogram"
+    assert edges[0] == 0 and edges[-1] == 1, "Edges should follow the given range"
+    
+    print("Histogram test passed!")
+
+
+def test_multiple_threads():
+    """Test that calls from several threads are all recorded."""
+    print("\n" + "=" * 60)
+    print("Test 11: Multiple Threads")
+    print("=" * 60)
+    
+    ProfilingWrapper.clear_profiling_data()
+    
+    obj = ProfilingWrapper(SampleClass())
+    
+    def worker():
+        for _ in range(100):
+            obj.increment_counter()
+    
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    times = ProfilingWrapper.get_profiling_data("SampleClass.increment_counter")
+    stats = ProfilingWrapper.get_statistics("SampleClass.increment_counter")
+    
+    print(f"\nCalls recorded across threads: {len(times)}")
+    
+    assert len(times) == 400, "Should record calls from every thread"
+    assert stats['count'] == 400, "Statistics should merge all threads"
+    
+    print("Multiple threads test passed!")
+
+
+def test_cached_method_skips_getattr():
+    """Test that repeated calls do not re-enter __getattr__."""
+    print("\n" + "=" * 60)
+    print("Test 12: Cached Method Skips __getattr__")
+    print("=" * 60)
+    
+    ProfilingWrapper.clear_profiling_data()
+    
+    original_getattr = ProfilingWrapper.__getattr__
+    lookups = []
+    
+    def counting_getattr(self, name):
+        lookups.append(name)
+        return original_getattr(self, name)
+    
+    ProfilingWrapper.__getattr__ = counting_getattr
+    try:
+        obj = ProfilingWrapper(SampleClass())
+        for _ in range(5):
+            obj.increment_counter()
+    finally:
+        ProfilingWrapper.__getattr__ = original_getattr
+    
+    times = ProfilingWrapper.get_profiling_data("SampleClass.increment_counter")
+    
+    print(f"\n__getattr__ lookups: {lookups}")
+    
+    assert lookups == ["increment_counter"], "__getattr__ should only run on first access"
+    assert len(times) == 5, "Every call should still be timed"
+    
+    print("Cached method skips __getattr__ test passed!")
+
+
+def test_exclude_and_auto_disable():
+    """Test excluded methods and automatic disabling of noise-level methods."""
+    print("\n" + "=" * 60)
+    print("Test 13: Exclude and Auto-Disable")
+    print("=" * 60)
+    
+    ProfilingWrapper.clear_profiling_data()
+    
+    obj = ProfilingWrapper(SampleClass(), exclude=("method_with_args",))
+    result = obj.method_with_args(1, 2)
+    
+    # A bare string names one method, not a set of characters
+    single = ProfilingWrapper(SampleClass(), exclude="fast_method")
+    single.fast_method()
+    single.slow_method()
+    
+    excluded_times = ProfilingWrapper.get_profiling_data("SampleClass.method_with_args")
+    
+    print(f"\nExcluded method calls recorded: {len(excluded_times)}")
+    
+    assert result == 3, "Excluded method should still return its result"
+    assert len(excluded_times) == 0, "Excluded method should not be profiled"
+    assert len(ProfilingWrapper.get_profiling_data("SampleClass.fast_method")) == 0, "String exclude should skip that method"
+    assert len(ProfilingWrapper.get_profiling_data("SampleClass.slow_method")) == 1, "String exclude should not skip other methods"
+    
+    # Every call is below a 1 second threshold, so profiling stops after
+    # the first 100 calls
+    obj = ProfilingWrapper(SampleClass(), auto_disable_below_ns=10**9)
+    for _ in range(150):
+        obj.increment_counter()
+    
+    times = ProfilingWrapper.get_profiling_data("SampleClass.increment_counter")
+    
+    print(f"Calls recorded before auto-disable: {len(times)}")
+    print(f"Final counter value: {obj.counter}")
+    
+    assert len(times) == 100, "Profiling should stop after 100 sub-threshold calls"
+    assert obj.counter == 150, "Calls should still reach the object after auto-disable"
+    
+    # Callables wrapped per access keep their streak across accesses
+    namespace = ProfilingWrapper(SimpleNamespace(go=lambda: "went"), auto_disable_below_ns=10**9)
+    for _ in range(150):
+        namespace.go()
+    
+    namespace_times = ProfilingWrapper.get_profiling_data("SimpleNamespace.go")
+    
+    print(f"Per-access calls recorded before auto-disable: {len(namespace_times)}")
+    
+    assert len(namespace_times) == 100, "Per-access callables should also be auto-disabled"
+    
+    print("Exclude and auto-disable test passed!")
+
+
+def test_callables_not_defined_on_class():
+    """Test that callables outside the class definition are still profiled."""
+    print("\n" + "=" * 60)
+    print("Test 14: Callables Not Defined on Class")
+    print("=" * 60)
+    
+    ProfilingWrapper.clear_profiling_data()
+    
+    class Proxy:
+        def __getattr__(self, name):
+            return lambda: name
+    
+    root = ProfilingWrapper(math).sqrt(4)
+    went = ProfilingWrapper(SimpleNamespace(go=lambda: "went")).go()
+    remote = ProfilingWrapper(Proxy()).remote()
+    
+    all_data = ProfilingWrapper.get_all_profiling_data()
+    
+    print(f"\nProfiled methods: {sorted(all_data)}")
+    
+    assert (root, went, remote) == (2.0, "went", "remote"), "Calls should return their results"
+    assert sorted(all_data) == ["Proxy.remote", "SimpleNamespace.go", "module.sqrt"], "All three calls should be profiled"
+    
+    print("Callables not defined on class test passed!")
+
+
+def test_replaced_methods():
+    """Test which method replacements the wrapper picks up."""
+    print("\n" + "=" * 60)
+    print("Test 15: Replaced Methods")
+    print("=" * 60)
+    
+    ProfilingWrapper.clear_profiling_data()
+    
+    # Replacing through the wrapper drops the cached timed method
+    inner = SampleClass()
+    obj = ProfilingWrapper(inner)
+    obj.fast_method()
+    obj.fast_method = lambda: "patched"
+    through_wrapper = obj.fast_method()
+    
+    # A callable already shadowing the class method is not cached
+    inner = SampleClass()
+    inner.slow_method = lambda: "first"
+    obj = ProfilingWrapper(inner)
+    first = obj.slow_method()
+    inner.slow_method = lambda: "second"
+    second = obj.slow_method()
+    
+    # Known limitation: replacing a cached method directly on the wrapped
+    # object is not seen by the wrapper
+    inner = SampleClass()
+    obj = ProfilingWrapper(inner)
+    obj.method_with_args(1, 2)
+    inner.method_with_args = lambda x, y: "patched"
+    stale = obj.method_with_args(1, 2)
+    
+    print(f"\nReplaced through wrapper: {through_wrapper}")
+    print(f"Shadowed on instance: {first}, {second}")
+    print(f"Replaced on wrapped object after caching: {stale}")
+    
+    assert through_wrapper == "patched", "Assigning through the wrapper should take effect"
+    assert (first, second) == ("first", "second"), "Instance callables should not be cached"
+    assert len(ProfilingWrapper.get_profiling_data("SampleClass.slow_method")) == 2, "Shadowing callables should be profiled"
+    assert stale == 3, "Cached method should still be called"
+    
+    print("Replaced methods test passed!")
+
+
+def test_exited_thread_buffers_dropped():
+    """Test that clearing drops buffers left behind by exited threads."""
+    print("\n" + "=" * 60)
+    print("Test 16: Exited Thread Buffers Dropped")
+    print("=" * 60)
+    
+    ProfilingWrapper.clear_profiling_data()
+    
+    obj = ProfilingWrapper(SampleClass())
+    obj.increment_counter()
+    
+    for _ in range(3):
+        threads = [threading.Thread(target=obj.increment_counter) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ProfilingWrapper.get_statistics("SampleClass.increment_counter")
+        ProfilingWrapper.clear_profiling_data()
+    
+    buffers = ProfilingWrapper._profiling_data["SampleClass.increment_counter"]
+    
+    print(f"\nBuffers after clearing: {len(buffers)}")
+    
+    assert len(buffers) <= 1, "Only the live main thread's buffer should remain"
+    
+    obj.increment_counter()
+    stats = ProfilingWrapper.get_statistics("SampleClass.increment_counter")
+    
+    assert stats['count'] == 1, "Live thread should keep recording after clear"
+    
+    print("Exited thread buffers dropped test passed!")
+
+
 if __name__ == "__main__":
     test_basic_functionality()
     test_method_arguments()
@@ -220,6 +533,15 @@ if __name__ == "__main__":
     test_multiple_objects()
     test_all_profiling_data()
     test_nonexistent_method()
+    test_cached_method_after_clear()
+    test_disable_profiling()
+    test_histogram()
+    test_multiple_threads()
+    test_cached_method_skips_getattr()
+    test_exclude_and_auto_disable()
+    test_callables_not_defined_on_class()
+    test_replaced_methods()
+    test_exited_thread_buffers_dropped()
     
     print("\n" + "=" * 60)
     print("All tests passed!" )